@@ -1,64 +1,152 @@
 """Configuration management for the Whisperrr FastAPI service."""
 
+import json
 import os
-from typing import List, Union, Dict
-from pydantic import validator, field_validator
-from pydantic_settings import BaseSettings
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, FrozenSet, List, Literal, Mapping, Optional, Tuple, Type, get_args
+from pydantic import AliasChoices, BeforeValidator, Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, PydanticBaseSettingsSource, SettingsConfigDict
+
+
+# Splits comma/whitespace separated CORS origins in a single pass
+_CORS_SPLIT = re.compile(r"[,\s]+")
+
+
+def _parse_cors_origins(v: Any) -> Any:
+    """Parse CORS origins from a JSON list, comma-separated string or list."""
+    if isinstance(v, str):
+        v = v.strip()
+        if v.startswith("["):
+            # JSON list from environment variables
+            return json.loads(v)
+        # Handle comma-separated string from environment variables
+        return [origin for origin in _CORS_SPLIT.split(v) if origin]
+    return v
+
+
+# Always a list of origins; NoDecode leaves env strings to _parse_cors_origins
+CorsOrigins = Annotated[List[str], NoDecode, BeforeValidator(_parse_cors_origins)]
+
+# Supported audio formats (including video formats that will be converted)
+SUPPORTED_FORMATS: FrozenSet[str] = frozenset({
+    # Audio formats
+    "mp3", "wav", "m4a", "flac", "ogg", "wma", "aac",
+    # Video formats (will be converted to audio)
+    "mp4", "avi", "mov", "mkv", "flv", "webm", "wmv", "m4v", "3gp"
+})
+
+# Formats that require conversion (video/music formats)
+FORMATS_REQUIRING_CONVERSION: FrozenSet[str] = frozenset({
+    "mp4", "avi", "mov", "mkv", "flv", "webm", "wmv", "m4v", "3gp", "aac"
+})
+
+# Model size options
+ModelSize = Literal["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]
+AVAILABLE_MODEL_SIZES: FrozenSet[str] = frozenset(get_args(ModelSize))
+
+# Model descriptions
+MODEL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "tiny": "Fastest, least accurate (39 MB)",
+    "base": "Good balance of speed and accuracy (74 MB)",
+    "small": "Better accuracy, slower (244 MB)",
+    "medium": "Good accuracy, slower (769 MB)",
+    "large": "Best accuracy, slowest (1550 MB)",
+    "large-v2": "Best accuracy, slowest (1550 MB)",
+    "large-v3": "Best accuracy, slowest (1550 MB)"
+})
+
+# Valid log levels and compute types
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+VALID_LOG_LEVELS: FrozenSet[str] = frozenset(get_args(LogLevel))
+VALID_COMPUTE_TYPES: FrozenSet[str] = frozenset({"int8", "int8_float16", "float16", "float32"})
+
+# Supported languages (Whisper supports 99 languages)
+SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset({
+    "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
+    "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
+    "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
+    "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
+    "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
+    "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
+    "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
+    "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
+    "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
+    "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su"
+})
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
+    # Read from .env file in the python-service directory, then environment variables
+    # This makes config.py the single source of truth for defaults
+    # Environment variables override .env file values
+    # Empty values (e.g. MODEL_SIZE=) fall back to the defaults below
+    # Frozen: the singleton is read-only once constructed
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_ignore_empty=True,
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True
+    )
+    
     # Model configuration
-    model_size: str = "base"
-    max_file_size_mb: int = 50  # 50MB - demo site limit
+    model_size: ModelSize = "base"
+    model_cache_dir: Optional[str] = None  # Where model weights are downloaded/loaded (None = Hugging Face cache)
+    model_warmup_enabled: bool = True  # Decode 1s of silence after loading so the first request skips kernel setup
+    max_cached_models: Annotated[int, Field(ge=1)] = 2  # Loaded model sizes kept in memory so switching back skips a reload
+    max_file_size_mb: Annotated[int, Field(gt=0, le=1000)] = 50  # 50MB - demo site limit
     upload_dir: str = "/tmp/whisperrr_uploads"
-    log_level: str = "INFO"
+    log_level: LogLevel = "INFO"
     
     # API configuration
     api_title: str = "Whisperrr Transcription Service"
     api_description: str = "Production-ready audio transcription using Faster Whisper"
     api_version: str = "1.0.0"
-    cors_origins: Union[List[str], str] = ["http://localhost:7331", "http://localhost:3737", "http://127.0.0.1:7331", "http://127.0.0.1:3737"]
+    cors_origins: CorsOrigins = ["http://localhost:7331", "http://localhost:3737", "http://127.0.0.1:7331", "http://127.0.0.1:3737"]
+    cors_max_age_seconds: int = 600  # How long browsers may cache CORS preflight responses
     
     # Processing configuration
     max_concurrent_transcriptions: int = 3
     request_timeout_seconds: int = 300
     cleanup_temp_files: bool = True
+    upload_chunk_size_bytes: int = 1024 * 1024  # Stream uploads to disk in 1MB chunks
+    result_cache_size: int = 128  # Cached transcriptions keyed by upload content hash, capped by count not bytes (0 disables)
+    audio_cache_mb: int = 128  # Decoded audio kept per upload content hash for re-runs with other options (0 disables)
     
     # Performance and monitoring
     enable_metrics: bool = True
     enable_health_checks: bool = True
+    memory_sample_interval_seconds: float = 1.0  # How often the cached RSS gauge is refreshed
+    
+    # Response compression (large transcription JSON payloads)
+    gzip_minimum_size_bytes: int = 1024  # Only compress responses at least this large
+    gzip_compress_level: int = 4  # 1-9; moderate level keeps CPU cost low under load
     
     # Performance tuning configuration
     # Uvicorn worker count (set via UVICORN_WORKERS env var, default calculated as (2 * CPU_COUNT) + 1)
     uvicorn_workers: int = 4
-    # Compute type for Whisper model (int8, float16, float32)
-    # int8: Fastest on CPU, lower accuracy
+    # Compute type for Whisper model (int8, int8_float16, float16, float32)
+    # int8: Fastest on CPU, lower accuracy (runs as int8_float16 on GPU)
     # float32: Best accuracy, slower on CPU
     # float16: GPU only, good balance
+    # int8_float16: GPU only, int8 weights with float16 compute, least VRAM
     compute_type: str = "int8"  # Can be overridden via COMPUTE_TYPE env var
-    # Thread count for NumPy/OpenMP operations (set via OMP_NUM_THREADS env var)
-    num_threads: int = 4
-    
-    # Supported audio formats (including video formats that will be converted)
-    supported_formats: List[str] = [
-        # Audio formats
-        "mp3", "wav", "m4a", "flac", "ogg", "wma", "aac",
-        # Video formats (will be converted to audio)
-        "mp4", "avi", "mov", "mkv", "flv", "webm", "wmv", "m4v", "3gp"
-    ]
-    
-    # Formats that require conversion (video/music formats)
-    formats_requiring_conversion: List[str] = [
-        "mp4", "avi", "mov", "mkv", "flv", "webm", "wmv", "m4v", "3gp", "aac"
-    ]
-    
-    # Model size options
-    available_model_sizes: List[str] = ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]
+    # Total CPU threads for Whisper inference, split across the CTranslate2 workers
+    # (set via NUM_THREADS, or OMP_NUM_THREADS as used for NumPy/OpenMP)
+    num_threads: int = Field(default=4, validation_alias=AliasChoices("num_threads", "omp_num_threads"))
+    # CTranslate2 model replicas; more than 1 lets concurrent requests decode in parallel
+    # at the cost of fewer threads (and a full model copy) per replica
+    model_num_workers: Annotated[int, Field(ge=1)] = 1
     
     # Transcription configuration
     beam_size: int = 5  # Beam size for transcription
+    vad_filter: bool = True  # Skip non-speech regions with Silero VAD before decoding
+    batch_size: Annotated[int, Field(ge=0)] = 0  # >1 decodes a file's VAD chunks in batches (BatchedInferencePipeline); best on GPU
     default_task: str = "translate"  # Transcription task type
     target_sample_rate: int = 16000  # Target sample rate in Hz
     audio_channels: int = 1  # Mono audio
@@ -82,74 +170,26 @@ class Settings(BaseSettings):
     # Server configuration (for development)
     server_host: str = "0.0.0.0"
     server_port: int = 5001
-    server_reload: bool = True  # Auto-reload for development
-    
-    # Model descriptions
-    model_descriptions: Dict[str, str] = {
-        "tiny": "Fastest, least accurate (39 MB)",
-        "base": "Good balance of speed and accuracy (74 MB)",
-        "small": "Better accuracy, slower (244 MB)",
-        "medium": "Good accuracy, slower (769 MB)",
-        "large": "Best accuracy, slowest (1550 MB)",
-        "large-v2": "Best accuracy, slowest (1550 MB)",
-        "large-v3": "Best accuracy, slowest (1550 MB)"
-    }
-    
-    # Supported languages (Whisper supports 99 languages)
-    supported_languages: List[str] = [
-        "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
-        "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
-        "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
-        "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
-        "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
-        "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
-        "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
-        "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
-        "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
-        "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su"
-    ]
-    
-    class Config:
-        # Read from .env file in the python-service directory, then environment variables
-        # This makes config.py the single source of truth for defaults
-        # Environment variables override .env file values
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-    
-    @validator("model_size")
-    def validate_model_size(cls, v):
-        """Validate model size is supported."""
-        valid_sizes = ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]
-        if v not in valid_sizes:
-            raise ValueError(f"Model size must be one of: {valid_sizes}")
-        return v
+    server_reload: bool = False  # Auto-reload; enable with SERVER_RELOAD=true for development only
+    server_limit_concurrency: int = 100  # Max in-flight connections before uvicorn answers 503
     
-    @validator("log_level")
-    def validate_log_level(cls, v):
-        """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
-        return v.upper()
-    
-    @validator("max_file_size_mb")
-    def validate_max_file_size(cls, v):
-        """Validate max file size is reasonable."""
-        if v <= 0:
-            raise ValueError("Max file size must be greater than 0 MB")
-        return v
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def normalize_log_level(cls, v: Any) -> Any:
+        """Uppercase log level before Literal validation."""
+        return v.upper() if isinstance(v, str) else v
     
-    @validator("compute_type")
-    def validate_compute_type(cls, v):
+    @field_validator("compute_type")
+    @classmethod
+    def validate_compute_type(cls, v: str) -> str:
         """Validate compute type is supported."""
-        valid_types = ["int8", "float16", "float32"]
-        if v.lower() not in valid_types:
-            raise ValueError(f"Compute type must be one of: {valid_types}")
+        if v.lower() not in VALID_COMPUTE_TYPES:
+            raise ValueError(f"Compute type must be one of: {sorted(VALID_COMPUTE_TYPES)}")
         return v.lower()
     
-    @validator("uvicorn_workers")
-    def validate_uvicorn_workers(cls, v):
+    @field_validator("uvicorn_workers")
+    @classmethod
+    def validate_uvicorn_workers(cls, v: int) -> int:
         """Validate uvicorn worker count is reasonable."""
         if v < 1:
             raise ValueError("Uvicorn workers must be at least 1")
@@ -157,8 +197,9 @@ class Settings(BaseSettings):
             raise ValueError("Uvicorn workers should not exceed 32")
         return v
     
-    @validator("num_threads")
-    def validate_num_threads(cls, v):
+    @field_validator("num_threads")
+    @classmethod
+    def validate_num_threads(cls, v: int) -> int:
         """Validate thread count is reasonable."""
         if v < 1:
             raise ValueError("Thread count must be at least 1")
@@ -166,19 +207,26 @@ class Settings(BaseSettings):
             raise ValueError("Thread count should not exceed 64")
         return v
     
-    @validator("upload_dir")
-    def validate_upload_dir(cls, v):
-        """Ensure upload directory exists."""
-        os.makedirs(v, exist_ok=True)
-        return v
+    @field_validator("upload_dir")
+    @classmethod
+    def validate_upload_dir(cls, v: str) -> str:
+        """Normalize upload directory path (created at startup, not here)."""
+        if not v or not v.strip():
+            raise ValueError("Upload directory must not be empty")
+        return os.path.abspath(v)
     
-    @validator("cors_origins", pre=True)
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from string or list."""
-        if isinstance(v, str):
-            # Handle comma-separated string from environment variables
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Read init kwargs, environment and .env only (no secrets dir)."""
+        # EnvSettingsSource snapshots os.environ into a dict once per construction
+        return init_settings, env_settings, dotenv_settings
     
     @property
     def max_file_size_bytes(self) -> int:
@@ -186,15 +234,46 @@ class Settings(BaseSettings):
         return self.max_file_size_mb * 1024 * 1024
     
     @property
-    def supported_formats_set(self) -> set:
+    def supported_formats(self) -> FrozenSet[str]:
+        """Get supported audio/video formats."""
+        return SUPPORTED_FORMATS
+    
+    @property
+    def formats_requiring_conversion(self) -> FrozenSet[str]:
+        """Get formats that must be converted to audio first."""
+        return FORMATS_REQUIRING_CONVERSION
+    
+    @property
+    def available_model_sizes(self) -> FrozenSet[str]:
+        """Get available Whisper model sizes."""
+        return AVAILABLE_MODEL_SIZES
+    
+    @property
+    def model_descriptions(self) -> Mapping[str, str]:
+        """Get human-readable descriptions of each model size."""
+        return MODEL_DESCRIPTIONS
+    
+    @property
+    def supported_languages(self) -> FrozenSet[str]:
+        """Get supported language codes."""
+        return SUPPORTED_LANGUAGES
+    
+    @property
+    def supported_formats_set(self) -> FrozenSet[str]:
         """Get supported formats as a set for faster lookup."""
-        return set(self.supported_formats)
+        return SUPPORTED_FORMATS
     
     @property
-    def formats_requiring_conversion_set(self) -> set:
+    def formats_requiring_conversion_set(self) -> FrozenSet[str]:
         """Get formats requiring conversion as a set for faster lookup."""
-        return set(self.formats_requiring_conversion)
+        return FORMATS_REQUIRING_CONVERSION
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached Settings instance."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
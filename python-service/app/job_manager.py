@@ -20,6 +20,12 @@ class JobStatus(str, Enum):
 class Job:
     """Represents a single transcription job."""
     
+    # Jobs are created per request and kept for hours, so skip the per-instance __dict__
+    __slots__ = (
+        "job_id", "status", "progress", "message", "result", "error",
+        "created_at", "updated_at", "_lock"
+    )
+    
     def __init__(self, job_id: str):
         self.job_id = job_id
         self.status = JobStatus.PENDING
@@ -65,14 +71,14 @@ class Job:
             self.updated_at = datetime.utcnow()
     
     def to_dict(self) -> Dict:
-        """Convert job to dictionary."""
+        """Convert job to dictionary (result stays a model to avoid a dump/re-validate round-trip)."""
         with self._lock:
             return {
                 "job_id": self.job_id,
                 "status": self.status.value,
                 "progress": self.progress,
                 "message": self.message,
-                "result": self.result.dict() if self.result else None,
+                "result": self.result,
                 "error": self.error,
                 "created_at": self.created_at.isoformat(),
                 "updated_at": self.updated_at.isoformat()
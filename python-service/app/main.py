@@ -1,15 +1,23 @@
 import os
 import tempfile
+import hashlib
 import logging
 import sys
+import traceback
 import uuid
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Optional, Tuple
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Request, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 import uvicorn
 
 from .config import settings
@@ -38,14 +46,19 @@ from .models import (
     HealthResponse,
     ErrorResponse,
     JobSubmissionResponse,
-    JobProgressResponse
+    JobProgressResponse,
+    CacheStatsResponse,
+    TranscriptionStreamError
 )
 from .whisper_service import whisper_service
 from .exceptions import WhisperrrException
 from .job_manager import job_manager, JobStatus
 from .utils import (
+    ensure_runtime_dirs,
+    cleanup_temp_file,
     get_correlation_id,
     get_memory_usage,
+    sample_memory_usage,
     safe_filename
 )
 
@@ -55,10 +68,17 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan: startup and shutdown."""
     # Startup
     cleanup_task = None
+    memory_task = None
     try:
+        # Create upload directory
+        ensure_runtime_dirs()
+        
         # Load Whisper model
         await whisper_service.load_model(settings.model_size)
         
+        # Sample RSS in the background so readers get a cached value
+        memory_task = asyncio.create_task(sample_memory_usage(settings.memory_sample_interval_seconds))
+        
         # Start background job cleanup task
         async def periodic_cleanup():
             """Periodically cleanup old jobs."""
@@ -71,20 +91,21 @@ async def lifespan(app: FastAPI):
                     logger.info("Job cleanup task cancelled")
                     break
                 except Exception as e:
-                    logger.error(f"Error in job cleanup: {e}", exc_info=True)
+                    logger.error("Error in job cleanup: %s", e, exc_info=True)
         
         cleanup_task = asyncio.create_task(periodic_cleanup())
-        logger.info(f"Started periodic job cleanup (interval: {settings.job_cleanup_interval_seconds}s)")
+        logger.info("Started periodic job cleanup (interval: %ss)", settings.job_cleanup_interval_seconds)
         
         yield
     finally:
         # Shutdown
-        if cleanup_task:
-            cleanup_task.cancel()
-            try:
-                await cleanup_task
-            except asyncio.CancelledError:
-                pass
+        for task in (cleanup_task, memory_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         await whisper_service.cleanup()
 
 
@@ -96,13 +117,43 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Allowance for multipart boundaries and form fields on top of the file itself
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+# Registered first so CORS and correlation headers still wrap its 413
+@app.middleware("http")
+async def upload_size_guard_middleware(request, call_next):
+    """Reject requests whose declared Content-Length exceeds the upload limit before reading the body."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > settings.max_file_size_bytes + _MULTIPART_OVERHEAD_BYTES:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"File too large. Maximum size: {settings.max_file_size_mb}MB"}
+            )
+    return await call_next(request)
+
+
+# Compress large JSON responses (segment-heavy transcriptions)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size_bytes,
+    compresslevel=settings.gzip_compress_level,
+    # Buffering inside the compressor would hold back streamed NDJSON lines
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",)
+)
+
+# Add CORS middleware (added after GZip so it wraps it)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists instead of "*" so preflights are answered without echoing request headers
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "X-Correlation-ID"],
+    expose_headers=["X-Correlation-ID"],
+    max_age=settings.cors_max_age_seconds,
 )
 
 
@@ -115,18 +166,34 @@ async def correlation_middleware(request, call_next):
     return response
 
 
+def model_json_response(
+    model: BaseModel,
+    status_code: int = 200,
+    background: Optional[BackgroundTask] = None
+) -> Response:
+    """Serialize a Pydantic model straight to JSON bytes with pydantic-core."""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+        background=background
+    )
+
+
+# HTTP status for each WhisperrrException error code
+_STATUS_CODE_MAP = MappingProxyType({
+    "INVALID_AUDIO_FORMAT": 400, "FILE_TOO_LARGE": 413, "MODEL_NOT_LOADED": 503,
+    "TRANSCRIPTION_FAILED": 500, "MODEL_LOAD_FAILED": 500,
+    "AUDIO_PROCESSING_ERROR": 400, "FILE_SYSTEM_ERROR": 500
+})
+
+
 # Global exception handler
 @app.exception_handler(WhisperrrException)
 async def whisperrr_exception_handler(request: Request, exc: WhisperrrException):
     """Handle custom Whisperrr exceptions."""
     correlation_id = getattr(request.state, 'correlation_id', None)
     
-    status_codes = {
-        "INVALID_AUDIO_FORMAT": 400, "FILE_TOO_LARGE": 413, "MODEL_NOT_LOADED": 503,
-        "TRANSCRIPTION_FAILED": 500, "MODEL_LOAD_FAILED": 500,
-        "AUDIO_PROCESSING_ERROR": 400, "FILE_SYSTEM_ERROR": 500
-    }
-    
     error_response = ErrorResponse(
         error_type=exc.error_code or "WHISPERRR_ERROR",
         message=exc.message,
@@ -134,21 +201,19 @@ async def whisperrr_exception_handler(request: Request, exc: WhisperrrException)
         correlation_id=correlation_id
     )
     
-    return JSONResponse(
-        status_code=status_codes.get(exc.error_code, 500),
-        content=error_response.dict()
-    )
+    return model_json_response(error_response, status_code=_STATUS_CODE_MAP.get(exc.error_code, 500))
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    import traceback
     correlation_id = getattr(request.state, 'correlation_id', None)
     
     # Log the full exception with traceback
     logger.error(
-        f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
+        "Unhandled exception: %s: %s",
+        type(exc).__name__,
+        exc,
         exc_info=True,
         extra={"correlation_id": correlation_id}
     )
@@ -164,10 +229,62 @@ async def general_exception_handler(request: Request, exc: Exception):
         correlation_id=correlation_id
     )
     
-    return JSONResponse(
-        status_code=500,
-        content=error_response.dict()
-    )
+    return model_json_response(error_response, status_code=500)
+
+
+def copy_upload_chunked(src: BinaryIO, dst: BinaryIO, hasher: Any) -> int:
+    """Copy a spooled upload into dst in chunks, reusing one buffer, enforcing the size limit."""
+    buffer = bytearray(settings.upload_chunk_size_bytes)
+    view = memoryview(buffer)
+    bytes_written = 0
+    while n := src.readinto(buffer):
+        bytes_written += n
+        if bytes_written > settings.max_file_size_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
+            )
+        # Slices of the memoryview hand the same buffer to the hasher and the file
+        chunk = view[:n]
+        hasher.update(chunk)
+        dst.write(chunk)
+    return bytes_written
+
+
+# Temp file suffix for common upload types; format detection keys off the extension
+_EXT_BY_MIME = MappingProxyType({
+    "audio/mpeg": ".mp3", "audio/wav": ".wav", "audio/x-wav": ".wav",
+    "audio/mp4": ".m4a", "audio/flac": ".flac", "audio/ogg": ".ogg"
+})
+
+
+def upload_suffix(file: UploadFile) -> str:
+    """Pick the temp file suffix from the content type, falling back to the sanitized filename."""
+    suffix = _EXT_BY_MIME.get(file.content_type)
+    if suffix is None:
+        suffix = f".{safe_filename(file.filename).split('.')[-1]}"
+    return suffix
+
+
+async def save_upload_to_temp_file(file: UploadFile, suffix: str) -> Tuple[str, str]:
+    """Stream an upload to a temp file, enforcing the size limit.
+    
+    Returns the temp file path and a content hash used as the result cache key.
+    """
+    # Seek before mkstemp so a failure here can't leak the descriptor
+    await file.seek(0)
+    fd, temp_file_path = tempfile.mkstemp(suffix=suffix)
+    hasher = hashlib.blake2b(digest_size=16)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            # Whole copy runs in one worker thread instead of one hop per chunk
+            await run_in_threadpool(copy_upload_chunked, file.file, temp_file, hasher)
+    except BaseException:
+        # Remove partial file on oversize upload, client disconnect or write error
+        cleanup_temp_file(temp_file_path)
+        raise
+    
+    return temp_file_path, hasher.hexdigest()
 
 
 # API Endpoints
@@ -195,25 +312,14 @@ async def transcribe_audio(
         if not file or not file.filename:
             raise HTTPException(status_code=400, detail="No file provided")
         
-        safe_name = safe_filename(file.filename)
-        
         if file.size and file.size > settings.max_file_size_bytes:
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
             )
         
-        import tempfile
-        import os
-        
-        content = await file.read()
-
-        # Create temp file
-        fd, temp_file_path = tempfile.mkstemp(suffix=f".{safe_name.split('.')[-1]}")
-        try:
-            os.write(fd, content)
-        finally:
-            os.close(fd)  # Ensure file is fully written and closed
+        # Stream upload to temp file (fully written and closed on return)
+        temp_file_path, content_hash = await save_upload_to_temp_file(file, upload_suffix(file))
 
         # Now the file is guaranteed to be on disk
         result = await whisper_service.transcribe_audio(
@@ -221,10 +327,14 @@ async def transcribe_audio(
             model_size=model_size,
             language=None,
             temperature=temperature,
-            task=settings.default_task
+            task=settings.default_task,
+            content_hash=content_hash
         )
         
-        return result
+        # Delete the upload after the response is sent rather than before
+        response = model_json_response(result, background=BackgroundTask(cleanup_temp_file, temp_file_path))
+        temp_file_path = None
+        return response
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -232,19 +342,95 @@ async def transcribe_audio(
     except Exception as e:
         file_name = file.filename if file else None
         logger.error(
-            f"Error processing transcription request: {type(e).__name__}: {str(e)}",
+            "Error processing transcription request: %s: %s",
+            type(e).__name__,
+            e,
             exc_info=True,
             extra={"correlation_id": correlation_id, "file_name": file_name}
         )
         raise
     finally:
+        # Error paths clean up immediately; success hands off to the background task
         if temp_file_path:
-            try:
-                import os
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-            except Exception:
-                pass
+            cleanup_temp_file(temp_file_path)
+
+
+@app.post("/transcribe/stream")
+async def transcribe_audio_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    model_size: Optional[str] = Query(None, description="Whisper model size"),
+    temperature: float = Query(0.0, ge=0.0, le=1.0, description="Temperature for sampling")
+):
+    """Transcribe audio file, streaming one NDJSON event per segment as it is decoded."""
+    correlation_id = getattr(request.state, 'correlation_id', None)
+    
+    if not whisper_service.is_model_loaded():
+        raise HTTPException(
+            status_code=503,
+            detail="Transcription model is not loaded. Please wait for the service to initialize."
+        )
+    
+    if not file or not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+    
+    if file.size and file.size > settings.max_file_size_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
+        )
+    
+    temp_file_path, content_hash = await save_upload_to_temp_file(file, upload_suffix(file))
+    events = whisper_service.stream_transcription(
+        file_path=temp_file_path,
+        model_size=model_size,
+        temperature=temperature,
+        content_hash=content_hash
+    )
+    
+    # Wait for the first event so validation and model errors still map to HTTP status codes
+    try:
+        first_event = await events.__anext__()
+    except BaseException:
+        await events.aclose()
+        cleanup_temp_file(temp_file_path)
+        raise
+    
+    async def ndjson_events():
+        try:
+            yield first_event.model_dump_json() + "\n"
+            async for event in events:
+                yield event.model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(
+                "Error streaming transcription: %s: %s",
+                type(e).__name__,
+                e,
+                exc_info=True,
+                extra={"correlation_id": correlation_id, "file_name": file.filename}
+            )
+            error = ErrorResponse(
+                error_type=getattr(e, "error_code", None) or "TRANSCRIPTION_FAILED",
+                message=getattr(e, "message", None) or str(e),
+                details=getattr(e, "details", None),
+                correlation_id=correlation_id
+            )
+            yield TranscriptionStreamError(error=error).model_dump_json() + "\n"
+        finally:
+            await events.aclose()
+            cleanup_temp_file(temp_file_path)
+    
+    async def close_stream():
+        await events.aclose()
+        cleanup_temp_file(temp_file_path)
+    
+    # The generator's finally never runs if the client disconnects before iteration starts
+    return StreamingResponse(
+        ndjson_events(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(close_stream)
+    )
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -261,7 +447,8 @@ async def process_transcription_job(
     job_id: str,
     file_path: str,
     model_size: Optional[str],
-    temperature: float
+    temperature: float,
+    content_hash: Optional[str] = None
 ):
     """Process transcription job asynchronously."""
     job = job_manager.get_job(job_id)
@@ -280,12 +467,13 @@ async def process_transcription_job(
             language=None,
             temperature=temperature,
             task=settings.default_task,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            content_hash=content_hash
         )
         
         job.set_result(result)
     except Exception as e:
-        logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+        logger.error("Job %s failed: %s", job_id, e, exc_info=True)
         job.set_error(f"Transcription failed: {str(e)}")
     finally:
         # Cleanup temp file
@@ -316,8 +504,6 @@ async def submit_transcription_job(
     if not file or not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
     
-    safe_name = safe_filename(file.filename)
-    
     if file.size and file.size > settings.max_file_size_bytes:
         raise HTTPException(
             status_code=413,
@@ -328,15 +514,8 @@ async def submit_transcription_job(
     job = job_manager.create_job()
     
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Create temp file
-        fd, temp_file_path = tempfile.mkstemp(suffix=f".{safe_name.split('.')[-1]}")
-        try:
-            os.write(fd, content)
-        finally:
-            os.close(fd)
+        # Stream upload to temp file
+        temp_file_path, content_hash = await save_upload_to_temp_file(file, upload_suffix(file))
         
         # Start background task
         background_tasks.add_task(
@@ -344,7 +523,8 @@ async def submit_transcription_job(
             job.job_id,
             temp_file_path,
             model_size,
-            temperature
+            temperature,
+            content_hash
         )
         
         return JobSubmissionResponse(
@@ -352,10 +532,15 @@ async def submit_transcription_job(
             status=JobStatus.PENDING.value,
             message="Job submitted successfully"
         )
+    except HTTPException:
+        job_manager.delete_job(job.job_id)
+        raise
     except Exception as e:
         job_manager.delete_job(job.job_id)
         logger.error(
-            f"Error submitting job: {type(e).__name__}: {str(e)}",
+            "Error submitting job: %s: %s",
+            type(e).__name__,
+            e,
             exc_info=True,
             extra={"correlation_id": correlation_id}
         )
@@ -373,6 +558,19 @@ async def get_job_progress(job_id: str):
     return JobProgressResponse(**job_dict)
 
 
+@app.get("/cache/stats", response_model=CacheStatsResponse)
+async def get_cache_stats():
+    """Get transcription result cache statistics."""
+    return whisper_service.get_cache_stats()
+
+
+@app.post("/cache/clear", response_model=CacheStatsResponse)
+async def clear_cache():
+    """Clear cached transcription results."""
+    whisper_service.clear_cache()
+    return whisper_service.get_cache_stats()
+
+
 
 
 
@@ -386,5 +584,9 @@ if __name__ == "__main__":
         host=settings.server_host,
         port=settings.server_port,
         reload=settings.server_reload,
+        # "auto" uses uvloop/httptools when installed; uvloop isn't available on Windows
+        loop="auto",
+        http="auto",
+        limit_concurrency=settings.server_limit_concurrency,
         log_level=settings.log_level.lower()
     )
@@ -1,7 +1,7 @@
 """Pydantic data models for the Whisperrr FastAPI service."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 
 
@@ -116,6 +116,40 @@ class ErrorResponse(BaseModel):
     timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+class TranscriptionStreamSegment(BaseModel):
+    """NDJSON line emitted by /transcribe/stream for each decoded segment."""
+    
+    type: Literal["segment"] = Field(default="segment", description="Stream event type")
+    segment: TranscriptionSegment = Field(description="Decoded segment")
+
+
+class TranscriptionStreamCompleted(BaseModel):
+    """Final NDJSON line emitted by /transcribe/stream once decoding finishes."""
+    
+    type: Literal["completed"] = Field(default="completed", description="Stream event type")
+    text: str = Field(description="Full transcribed text")
+    language: Optional[str] = Field(description="Detected language")
+    duration: float = Field(description="Audio duration in seconds")
+    model_used: str = Field(description="Whisper model size used")
+    processing_time: float = Field(description="Processing time in seconds")
+
+
+class TranscriptionStreamError(BaseModel):
+    """NDJSON line emitted by /transcribe/stream when decoding fails mid-stream."""
+    
+    type: Literal["error"] = Field(default="error", description="Stream event type")
+    error: ErrorResponse = Field(description="Error details")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for transcription result cache statistics."""
+    
+    size: int = Field(description="Number of cached transcriptions")
+    max_size: int = Field(description="Maximum number of cached transcriptions")
+    hits: int = Field(description="Cache hits since startup or last clear")
+    misses: int = Field(description="Cache misses since startup or last clear")
+
+
 class JobSubmissionResponse(BaseModel):
     """Response model for job submission."""
     
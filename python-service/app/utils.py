@@ -1,5 +1,6 @@
 """Utility functions for file handling and audio processing."""
 
+import asyncio
 import os
 import uuid
 import subprocess
@@ -8,7 +9,7 @@ import warnings
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, Callable
 import librosa
-import soundfile as sf
+import numpy as np
 
 # Suppress librosa's PySoundFile fallback warning (it's expected behavior)
 warnings.filterwarnings("ignore", message="PySoundFile failed. Trying audioread instead.")
@@ -22,6 +23,27 @@ from .exceptions import (
 )
 
 
+_runtime_dirs_ready = False
+
+
+def ensure_runtime_dirs() -> None:
+    """Create runtime directories (upload dir) once per process."""
+    global _runtime_dirs_ready
+    if _runtime_dirs_ready:
+        return
+    
+    try:
+        os.makedirs(settings.upload_dir, exist_ok=True)
+    except Exception as e:
+        raise FileSystemError(
+            message="Failed to create upload directory",
+            operation="ensure_runtime_dirs",
+            file_path=settings.upload_dir,
+            original_error=str(e)
+        )
+    _runtime_dirs_ready = True
+
+
 def get_file_extension(filename: str) -> str:
     """Extract file extension from filename."""
     return Path(filename).suffix.lower().lstrip('.')
@@ -434,8 +456,8 @@ def convert_video_to_audio(input_path: str, output_path: Optional[str] = None, p
         )
 
 
-def preprocess_audio(file_path: str, target_sr: Optional[int] = None, progress_callback: Optional[Callable[[float, str], None]] = None) -> str:
-    """Preprocess audio file for Whisper with validation and conversion."""
+def preprocess_audio(file_path: str, target_sr: Optional[int] = None, progress_callback: Optional[Callable[[float, str], None]] = None) -> np.ndarray:
+    """Preprocess audio file for Whisper and return mono float32 samples at target_sr."""
     from .config import settings
     
     if target_sr is None:
@@ -481,24 +503,21 @@ def preprocess_audio(file_path: str, target_sr: Optional[int] = None, progress_c
             else:
                 update_progress(10.0, "Audio file is valid")
         
-        # Get audio info
-        update_progress(30.0, "Analyzing audio properties...")
-        audio_info = get_audio_info(file_path)
-        
         update_progress(32.0, "Loading audio data...")
         # Load audio
         try:
             audio, sr = librosa.load(file_path, sr=None)
         except Exception as e:
-            # If loading fails, try converting the file
-            if not converted_file:  # Only convert if we haven't already
-                update_progress(35.0, "Audio loading failed, converting file...")
-                converted_file = convert_audio_file(file_path, progress_callback=lambda p, m: update_progress(35.0 + p * 0.05, m))
-                file_path = converted_file
-        audio, sr = librosa.load(file_path, sr=None)
+            # If loading fails, try converting the file (once; a converted file that fails is an error)
+            if converted_file:
+                raise
+            update_progress(35.0, "Audio loading failed, converting file...")
+            converted_file = convert_audio_file(file_path, progress_callback=lambda p, m: update_progress(35.0 + p * 0.05, m))
+            file_path = converted_file
+            audio, sr = librosa.load(file_path, sr=None)
         
-        # Cleanup converted file after loading (no longer needed)
-        if converted_file and os.path.exists(converted_file) and converted_file != file_path:
+        # Cleanup converted file after loading (audio is now in memory)
+        if converted_file and os.path.exists(converted_file):
             try:
                 cleanup_temp_file(converted_file)
                 converted_file = None  # Mark as cleaned up
@@ -516,15 +535,9 @@ def preprocess_audio(file_path: str, target_sr: Optional[int] = None, progress_c
         update_progress(38.0, "Normalizing audio levels...")
         audio = librosa.util.normalize(audio)
         
-        # Create output file
-        update_progress(39.0, "Saving preprocessed audio...")
-        output_path, _ = create_temp_file("wav")
-        
-        # Save as WAV (Whisper prefers WAV format)
-        sf.write(output_path, audio, sr, format='WAV', subtype='PCM_16')
-        
+        # Hand samples to Whisper directly instead of writing and re-decoding a WAV
         update_progress(40.0, "Audio preprocessing completed, ready for transcription")
-        return output_path
+        return audio.astype(np.float32, copy=False)
     
     except Exception as e:
         # Cleanup converted file on error
@@ -570,7 +583,7 @@ def validate_audio_file(file_path: str) -> Dict[str, Any]:
         if not format_to_check or format_to_check not in settings.supported_formats_set:
             raise InvalidAudioFormat(
                 file_format=format_to_check or "unknown",
-                supported_formats=settings.supported_formats
+                supported_formats=sorted(settings.supported_formats)
             )
         
         # Try to get audio info (this will fail if file is corrupted)
@@ -623,8 +636,30 @@ def validate_audio_file(file_path: str) -> Dict[str, Any]:
         )
 
 
+# Last RSS sample taken by sample_memory_usage (None until the sampler runs)
+_memory_usage_mb: Optional[float] = None
+
+
 def get_memory_usage() -> float:
-    """Get current memory usage in MB."""
+    """Get current memory usage in MB, from the background sample when available."""
+    if _memory_usage_mb is not None:
+        return _memory_usage_mb
+    return read_memory_usage()
+
+
+async def sample_memory_usage(interval_seconds: float) -> None:
+    """Refresh the cached memory usage every interval until cancelled."""
+    global _memory_usage_mb
+    try:
+        while True:
+            _memory_usage_mb = read_memory_usage()
+            await asyncio.sleep(interval_seconds)
+    finally:
+        _memory_usage_mb = None
+
+
+def read_memory_usage() -> float:
+    """Read current memory usage in MB from the OS."""
     try:
         import psutil
         process = psutil.Process()
@@ -676,7 +711,7 @@ def safe_filename(filename: str) -> str:
 
 def get_correlation_id() -> str:
     """Generate a unique correlation ID for request tracking."""
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
 
 
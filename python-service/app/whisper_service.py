@@ -2,18 +2,23 @@
 
 import asyncio
 import time
-import threading
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Set, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.vad import get_speech_timestamps
 
-from .config import settings
+from .config import settings, SUPPORTED_LANGUAGES
 from .models import (
     TranscriptionResponse,
     TranscriptionSegment,
-    ModelInfoResponse
+    TranscriptionStreamSegment,
+    TranscriptionStreamCompleted,
+    ModelInfoResponse,
+    CacheStatsResponse
 )
 from .exceptions import (
     WhisperrrException,
@@ -25,56 +30,57 @@ from .exceptions import (
 from .utils import (
     preprocess_audio,
     validate_audio_file,
-    get_memory_usage,
-    cleanup_temp_file
+    get_memory_usage
 )
 
 
+# Supported languages in stable order for API responses, sorted once at import
+_SUPPORTED_LANGUAGES_SORTED: Tuple[str, ...] = tuple(sorted(SUPPORTED_LANGUAGES))
+
+
 class WhisperService:
-    """Singleton service for managing Faster Whisper models and transcription."""
+    """Service for managing Faster Whisper models and transcription; use the module-level instance."""
     
-    _instance = None
-    _lock = threading.Lock()
     _logger = logging.getLogger(__name__)
     
-    def __new__(cls):
-        """Ensure singleton pattern with thread-safe double-checked locking."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        """Initialize the WhisperService singleton instance."""
-        if hasattr(self, '_initialized'):
-            return
-        
-        self._initialized = True
+        """Initialize the WhisperService instance."""
         self._model = None
         self._model_size = None
         self._model_load_time = None
+        # last_loaded datetime memoized per load time for status probes
+        self._last_loaded_ts = None
+        self._last_loaded_dt = None
+        # LRU of loaded models (model, load time) keyed by size; the active model is the most recent
+        self._models: "OrderedDict[str, Tuple[WhisperModel, float]]" = OrderedDict()
         self._is_loading = False
-        self._active_transcriptions = 0
-        self._start_time = time.time()
+        self._loading_model_size = None
+        self._load_lock = asyncio.Lock()
+        # One future per in-flight transcription, resolved when it finishes
+        self._active_transcriptions: Set[asyncio.Future] = set()
+        self._start_time = time.monotonic()
         self._executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_transcriptions)
         
+        # LRU cache of transcription results keyed by (content hash, model, options)
+        self._result_cache: "OrderedDict[Tuple, TranscriptionResponse]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # LRU cache of decoded audio keyed by content hash, bounded by total bytes
+        self._audio_cache: "OrderedDict[str, Tuple[Dict[str, Any], np.ndarray]]" = OrderedDict()
+        self._audio_cache_bytes = 0
+        
         # Detect device and compute type
         self._device = self._detect_device()
         self._compute_type = self._get_compute_type()
         
         # Log device and compute type for debugging
         self._logger.info(
-            f"WhisperService initialized: device={self._device}, compute_type={self._compute_type}, "
-            f"max_concurrent_transcriptions={settings.max_concurrent_transcriptions}"
+            "WhisperService initialized: device=%s, compute_type=%s, max_concurrent_transcriptions=%s",
+            self._device,
+            self._compute_type,
+            settings.max_concurrent_transcriptions
         )
-        
-        # Model descriptions from config
-        self._model_descriptions = settings.model_descriptions
-        
-        # Supported languages from config
-        self._supported_languages = settings.supported_languages
-        
     
     def _detect_device(self) -> str:
         """Detect available device (cuda or cpu)."""
@@ -98,9 +104,12 @@ class WhisperService:
         
         # Validate compute type is appropriate for the device
         if self._device == "cuda":
-            # GPU supports float16 and float32
-            if configured_type in ["float16", "float32"]:
+            # GPU supports int8_float16, float16 and float32
+            if configured_type in ["int8_float16", "float16", "float32"]:
                 return configured_type
+            # int8 on GPU: int8 weights with float16 activations (INT8 GEMM, ~half the VRAM)
+            if configured_type == "int8":
+                return "int8_float16"
             # Default to float16 for GPU (best performance/accuracy balance)
             return "float16"
         else:
@@ -117,29 +126,59 @@ class WhisperService:
         if model_size is None:
             model_size = settings.model_size
         
-        # Check if model is already loaded
-        if self._model is not None and self._model_size == model_size and not self._is_loading:
-            return {
-                "success": True,
-                "model_size": model_size,
-                "load_time_seconds": 0.0,
-                "memory_usage_mb": get_memory_usage(),
-                "message": f"Model {model_size} already loaded"
-            }
+        # Models already in memory don't need the lock, so serve them even while another size loads
+        loaded = self._activate_loaded_model(model_size)
+        if loaded is not None:
+            return loaded
         
-        # Prevent concurrent loading
-        if self._is_loading:
+        # Fail fast if a different model is mid-load; same-size callers wait below
+        if self._is_loading and self._loading_model_size != model_size:
             raise ModelLoadFailed(
                 message="Model is already being loaded",
                 model_size=model_size
             )
         
-        self._is_loading = True
-        start_time = time.time()
+        async with self._load_lock:
+            # The caller we waited on may have loaded it
+            loaded = self._activate_loaded_model(model_size)
+            if loaded is not None:
+                return loaded
+            
+            self._is_loading = True
+            self._loading_model_size = model_size
+            try:
+                return await self._load_model_locked(model_size)
+            finally:
+                self._is_loading = False
+                self._loading_model_size = None
+    
+    def _activate_loaded_model(self, model_size: str) -> Optional[dict]:
+        """Make an in-memory model current without loading, or return None if it must be loaded."""
+        # Switch back to a model kept from an earlier load instead of reloading it
+        cached = self._models.get(model_size)
+        if cached is not None:
+            self._models.move_to_end(model_size)
+            self._model, self._model_load_time = cached
+            self._model_size = model_size
+        
+        if self._model is None or self._model_size != model_size:
+            return None
+        
+        return {
+            "success": True,
+            "model_size": model_size,
+            "load_time_seconds": 0.0,
+            "memory_usage_mb": get_memory_usage(),
+            "message": f"Model {model_size} already loaded"
+        }
+    
+    async def _load_model_locked(self, model_size: str) -> dict:
+        """Load a model; caller must hold _load_lock."""
+        start_time = time.monotonic()
         
         try:
             # Load model in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self._model = await loop.run_in_executor(
                 self._executor,
                 self._load_model_sync,
@@ -148,7 +187,12 @@ class WhisperService:
             
             self._model_size = model_size
             self._model_load_time = time.time()
-            load_time = time.time() - start_time
+            load_time = time.monotonic() - start_time
+            
+            # Evicted models are freed once in-flight transcriptions using them finish
+            self._models[model_size] = (self._model, self._model_load_time)
+            while len(self._models) > settings.max_cached_models:
+                self._models.popitem(last=False)
             
             return {
                 "success": True,
@@ -164,21 +208,46 @@ class WhisperService:
                 model_size=model_size,
                 original_error=str(e)
             )
-        
-        finally:
-            self._is_loading = False
     
     def _load_model_sync(self, model_size: str):
         """Synchronous model loading (runs in thread pool)."""
         # Load the Faster Whisper model
+        # One worker by default so a lone request decodes on every thread; extra workers
+        # each hold their own model replica, and cpu_threads applies per worker,
+        # so split the thread budget across them instead of oversubscribing the CPUs.
+        num_workers = settings.model_num_workers
         model = WhisperModel(
             model_size,
             device=self._device,
-            compute_type=self._compute_type
+            compute_type=self._compute_type,
+            cpu_threads=max(1, settings.num_threads // num_workers),
+            num_workers=num_workers,
+            download_root=settings.model_cache_dir
         )
         
+        # Warm up before the model is published so no request sees a cold model
+        if settings.model_warmup_enabled:
+            self._warmup_model_sync(model)
+        
         return model
     
+    def _warmup_model_sync(self, model: WhisperModel) -> None:
+        """Decode one second of silence, and run VAD on it, so setup happens at load time, not on the first request."""
+        start_time = time.monotonic()
+        try:
+            silence = np.zeros(settings.target_sample_rate, dtype=np.float32)
+            # VAD would strip the silence and skip the decoder entirely
+            options = {**self._transcription_options(0.0), "vad_filter": False}
+            segments, _ = model.transcribe(silence, **options)
+            for _ in segments:
+                pass
+            # So warm the Silero VAD session on its own
+            if settings.vad_filter:
+                get_speech_timestamps(silence)
+            self._logger.info("Model warmup completed in %.3fs", time.monotonic() - start_time)
+        except Exception as e:
+            self._logger.warning("Model warmup failed, first request will be slower: %s", e)
+    
     async def transcribe_audio(
         self,
         file_path: str,
@@ -186,9 +255,10 @@ class WhisperService:
         language: Optional[str] = None,
         temperature: float = 0.0,
         task: str = "transcribe",
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        content_hash: Optional[str] = None
     ) -> TranscriptionResponse:
-        """Transcribe audio file using Faster Whisper."""
+        """Transcribe audio file using Faster Whisper, reusing cached results for identical content."""
         if self._model is None:
             raise ModelNotLoaded("No model is currently loaded")
         
@@ -196,58 +266,63 @@ class WhisperService:
             # Load different model if requested
             await self.load_model(model_size)
         
-        start_time = time.time()
-        self._active_transcriptions += 1
+        # Pin the model so a concurrent switch can't change it mid-request
+        model = self._model
+        model_used = self._model_size
+        start_time = time.monotonic()
+        
+        cache_key = None
+        if content_hash and settings.result_cache_size > 0:
+            cache_key = (content_hash, model_used, task, language, temperature)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                if progress_callback:
+                    progress_callback(100.0, "Transcription completed (cached result)")
+                return cached.model_copy(
+                    update={"processing_time": round(time.monotonic() - start_time, 3)}
+                )
+            self._cache_misses += 1
+        
+        done = self._begin_transcription()
         
         try:
-            # Validate audio file
-            if progress_callback:
-                progress_callback(0.0, "Validating file format...")
-            file_info = validate_audio_file(file_path)
-            if file_info is None:
-                raise TranscriptionFailed(
-                    message="File validation returned None",
-                    original_error="validate_audio_file returned None",
-                    file_path=file_path
-                )
+            file_info, audio = await self._prepare_audio(file_path, progress_callback, content_hash)
             
-            # Preprocess audio
-            processed_file = None
-            try:
-                processed_file = preprocess_audio(file_path, progress_callback=progress_callback)
-                
-                # Run transcription in thread pool
-                def transcription_callback(p: float, m: str):
-                    if progress_callback:
-                        # Map transcription progress (0-100%) to overall progress (40-100%)
-                        progress_range = settings.transcription_progress_max - settings.transcription_progress_min
-                        mapped_progress = settings.transcription_progress_min + (p * progress_range / 100.0)
-                        progress_callback(mapped_progress, m)
-                
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    self._executor,
-                    self._transcribe_sync,
-                    processed_file,
-                    language,
-                    temperature,
-                    task,
-                    transcription_callback
-                )
-                
-                processing_time = time.time() - start_time
-                
-                # Convert result to response model
-                response = self._create_transcription_response(
-                    result, file_info, processing_time
-                )
-                
-                return response
+            # Run transcription in thread pool
+            def transcription_callback(p: float, m: str):
+                if progress_callback:
+                    # Map transcription progress (0-100%) to overall progress (40-100%)
+                    progress_range = settings.transcription_progress_max - settings.transcription_progress_min
+                    mapped_progress = settings.transcription_progress_min + (p * progress_range / 100.0)
+                    progress_callback(mapped_progress, m)
             
-            finally:
-                # Cleanup processed file
-                if processed_file and settings.cleanup_temp_files:
-                    cleanup_temp_file(processed_file)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor,
+                self._transcribe_sync,
+                audio,
+                language,
+                temperature,
+                task,
+                transcription_callback,
+                model
+            )
+            
+            processing_time = time.monotonic() - start_time
+            
+            # Convert result to response model
+            response = self._create_transcription_response(
+                result, file_info, processing_time, model_used
+            )
+            
+            if cache_key is not None:
+                self._result_cache[cache_key] = response
+                while len(self._result_cache) > settings.result_cache_size:
+                    self._result_cache.popitem(last=False)
+            
+            return response
         
         except WhisperrrException:
             # Re-raise Whisperrr exceptions as-is so they're handled properly
@@ -260,37 +335,192 @@ class WhisperService:
             )
         
         finally:
-            self._active_transcriptions -= 1
+            self._end_transcription(done)
     
-    def _transcribe_sync(
+    async def stream_transcription(
+        self,
+        file_path: str,
+        model_size: Optional[str] = None,
+        temperature: float = 0.0,
+        content_hash: Optional[str] = None
+    ) -> AsyncIterator[Union[TranscriptionStreamSegment, TranscriptionStreamCompleted]]:
+        """Transcribe audio file, yielding each segment as soon as Faster Whisper decodes it."""
+        if self._model is None:
+            raise ModelNotLoaded("No model is currently loaded")
+        
+        if model_size and model_size != self._model_size:
+            await self.load_model(model_size)
+        
+        model = self._model
+        model_used = self._model_size
+        start_time = time.monotonic()
+        done = self._begin_transcription()
+        
+        try:
+            file_info, audio = await self._prepare_audio(file_path, content_hash=content_hash)
+            
+            loop = asyncio.get_running_loop()
+            options = self._transcription_options(temperature)
+            segments_generator, info = await loop.run_in_executor(
+                self._executor,
+                lambda: self._decode(model, audio, options)
+            )
+            
+            # The generator decodes lazily, so each step runs in the pool as its own task
+            text_parts = []
+            while True:
+                seg = await loop.run_in_executor(self._executor, next, segments_generator, None)
+                if seg is None:
+                    break
+                seg_text = seg.text.strip()
+                if seg_text:
+                    text_parts.append(seg_text)
+                yield TranscriptionStreamSegment(
+                    segment=TranscriptionSegment.model_construct(
+                        start_time=seg.start, end_time=seg.end, text=seg_text, confidence=None
+                    )
+                )
+            
+            yield TranscriptionStreamCompleted(
+                text=" ".join(text_parts),
+                language=info.language,
+                duration=file_info.get("duration") or 0.0,
+                model_used=model_used,
+                processing_time=round(time.monotonic() - start_time, 3)
+            )
+        
+        except WhisperrrException:
+            raise
+        except Exception as e:
+            raise TranscriptionFailed(
+                message="Transcription failed",
+                original_error=str(e),
+                file_path=file_path
+            )
+        
+        finally:
+            self._end_transcription(done)
+    
+    def _begin_transcription(self) -> asyncio.Future:
+        """Register an in-flight transcription so cleanup can wait for it."""
+        done = asyncio.get_running_loop().create_future()
+        self._active_transcriptions.add(done)
+        return done
+    
+    def _end_transcription(self, done: asyncio.Future) -> None:
+        """Mark an in-flight transcription as finished."""
+        self._active_transcriptions.discard(done)
+        done.set_result(None)
+    
+    async def _prepare_audio(
         self,
         file_path: str,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        content_hash: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], np.ndarray]:
+        """Validate audio file and decode it into in-memory samples, reusing cached samples for identical content."""
+        # The cache is only touched on the event loop, so it needs no lock
+        if content_hash:
+            cached = self._audio_cache.get(content_hash)
+            if cached is not None:
+                self._audio_cache.move_to_end(content_hash)
+                if progress_callback:
+                    progress_callback(settings.preprocessing_progress_max, "Reusing decoded audio...")
+                return cached
+        
+        # Decoding and resampling hold the GIL for long stretches, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        file_info, audio = await loop.run_in_executor(
+            self._executor,
+            self._prepare_audio_sync,
+            file_path,
+            progress_callback
+        )
+        if content_hash:
+            self._cache_audio(content_hash, file_info, audio)
+        return file_info, audio
+    
+    def _prepare_audio_sync(
+        self,
+        file_path: str,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> Tuple[Dict[str, Any], np.ndarray]:
+        """Synchronous validation and decoding (runs in thread pool)."""
+        if progress_callback:
+            progress_callback(0.0, "Validating file format...")
+        file_info = validate_audio_file(file_path)
+        if file_info is None:
+            raise TranscriptionFailed(
+                message="File validation returned None",
+                original_error="validate_audio_file returned None",
+                file_path=file_path
+            )
+        
+        audio = preprocess_audio(file_path, progress_callback=progress_callback)
+        return file_info, audio
+    
+    def _cache_audio(self, content_hash: str, file_info: Dict[str, Any], audio: np.ndarray) -> None:
+        """Keep decoded audio for re-transcription, evicting least recently used entries past the byte budget."""
+        budget = settings.audio_cache_mb * 1024 * 1024
+        if audio.nbytes > budget or content_hash in self._audio_cache:
+            return
+        
+        # Shared between requests, so guard against in-place edits
+        audio.flags.writeable = False
+        self._audio_cache[content_hash] = (file_info, audio)
+        self._audio_cache_bytes += audio.nbytes
+        while self._audio_cache_bytes > budget:
+            _, (_, evicted) = self._audio_cache.popitem(last=False)
+            self._audio_cache_bytes -= evicted.nbytes
+    
+    def _transcription_options(
+        self,
+        temperature: float,
+        language: Optional[str] = None,
+        task: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Decoding options shared by buffered and streaming transcription."""
+        return {
+            "beam_size": settings.beam_size,
+            "temperature": temperature,
+            "language": language,
+            "task": task or settings.default_task,
+            "vad_filter": settings.vad_filter
+        }
+    
+    def _decode(self, model: WhisperModel, audio: Union[str, np.ndarray], options: Dict[str, Any]):
+        """Start decoding, batching the file's VAD chunks together when batch_size > 1."""
+        # Batched decoding splits the file on VAD speech segments, so it needs VAD enabled
+        if settings.batch_size > 1 and options.get("vad_filter"):
+            # The pipeline keeps per-call state, so each transcription gets its own
+            pipeline = BatchedInferencePipeline(model=model)
+            return pipeline.transcribe(audio, batch_size=settings.batch_size, **options)
+        return model.transcribe(audio, **options)
+    
+    def _transcribe_sync(
+        self,
+        audio: Union[str, np.ndarray],
         language: Optional[str],
         temperature: float,
         task: str,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        model: Optional[WhisperModel] = None
     ):
         """Synchronous transcription (runs in thread pool)."""
-        # Prepare transcription options
-        options = {
-            "beam_size": settings.beam_size,
-            "temperature": temperature,
-            "task": settings.default_task
-        }
+        options = self._transcription_options(temperature, language, task)
         
         if progress_callback:
             progress_callback(0.0, "Initializing Whisper model...")
         if progress_callback:
             progress_callback(5.0, "Starting audio transcription...")
         
-        segments_generator, info = self._model.transcribe(file_path, **options)
+        segments_generator, info = self._decode(model or self._model, audio, options)
         segments = list(segments_generator)
         
         if info is None:
             raise TranscriptionFailed(
                 message="Transcription returned None info object",
-                original_error="info is None",
-                file_path=file_path
+                original_error="info is None"
             )
         
         if progress_callback:
@@ -315,8 +545,7 @@ class WhisperService:
         if info is None:
             raise TranscriptionFailed(
                 message="Transcription info object is None",
-                original_error="info is None",
-                file_path=file_path
+                original_error="info is None"
             )
         
         # Safely extract language and language_probability
@@ -364,7 +593,8 @@ class WhisperService:
         self,
         whisper_result: Dict[str, Any],
         file_info: Optional[Dict[str, Any]],
-        processing_time: float
+        processing_time: float,
+        model_used: Optional[str] = None
     ) -> TranscriptionResponse:
         """Create TranscriptionResponse from Faster Whisper result."""
         if whisper_result is None:
@@ -376,36 +606,36 @@ class WhisperService:
         
         # Extract text and segments
         text_from_result = whisper_result.get("text", "")
-        segments_data = whisper_result.get("segments", [])
+        segments_data = whisper_result.get("segments") or []
         
-        # Extract segments
+        # Build segments and collect log probabilities in a single pass
+        # model_construct skips validation: every field here is generated by the server
         segments = []
-        if segments_data is None:
-            segments_data = []
-        
-        for idx, segment in enumerate(segments_data):
-            seg_text = segment.get("text", "").strip() if isinstance(segment, dict) else ""
-            segments.append(TranscriptionSegment(
-                start_time=segment.get("start", 0.0) if isinstance(segment, dict) else 0.0,
-                end_time=segment.get("end", 0.0) if isinstance(segment, dict) else 0.0,
-                text=seg_text,
+        logprobs = []
+        for segment in segments_data:
+            if not isinstance(segment, dict):
+                segments.append(TranscriptionSegment.model_construct(start_time=0.0, end_time=0.0, text="", confidence=None))
+                continue
+            
+            avg_logprob = segment.get("avg_logprob")
+            if avg_logprob is not None:
+                logprobs.append(avg_logprob)
+            
+            segments.append(TranscriptionSegment.model_construct(
+                start_time=segment.get("start", 0.0),
+                end_time=segment.get("end", 0.0),
+                text=segment.get("text", "").strip(),
                 confidence=None  # Faster Whisper doesn't provide direct confidence scores
             ))
         
         # Calculate overall confidence (if available)
         confidence_score = None
-        if "segments" in whisper_result and whisper_result["segments"]:
-            # Use average of segment-level log probabilities if available
-            confidences = [
-                seg.get("avg_logprob", 0) for seg in whisper_result["segments"]
-                if seg.get("avg_logprob") is not None
-            ]
-            if confidences:
-                # Convert log probability to confidence score (approximate)
-                # avg_logprob is typically negative, so we normalize it
-                avg_logprob = sum(confidences) / len(confidences)
-                # Convert to a 0-1 scale (rough approximation)
-                confidence_score = max(0, min(1, (avg_logprob + 1) / 2))
+        if logprobs:
+            # Convert log probability to confidence score (approximate)
+            # avg_logprob is typically negative, so we normalize it
+            avg_logprob = sum(logprobs) / len(logprobs)
+            # Convert to a 0-1 scale (rough approximation)
+            confidence_score = max(0.0, min(1.0, (avg_logprob + 1) / 2))
         
         # Safely extract duration from file_info (handle None case)
         duration = 0.0
@@ -421,13 +651,13 @@ class WhisperService:
             segment_texts = [seg.text.strip() for seg in segments if hasattr(seg, 'text') and seg.text]
             final_text = " ".join(segment_texts)
         
-        response = TranscriptionResponse(
+        response = TranscriptionResponse.model_construct(
             text=final_text,
             language=whisper_result.get("language"),
             duration=duration,
             segments=segments,
             confidence_score=confidence_score,
-            model_used=self._model_size,
+            model_used=model_used or self._model_size,
             processing_time=round(processing_time, 3)
         )
         
@@ -439,19 +669,43 @@ class WhisperService:
             model_size=self._model_size or "none",
             memory_usage_mb=get_memory_usage(),
             load_time_seconds=0.0 if not self._model_load_time else time.time() - self._model_load_time,
-            supported_languages=self._supported_languages,
+            supported_languages=_SUPPORTED_LANGUAGES_SORTED,
             is_loaded=self._model is not None,
-            last_loaded=datetime.fromtimestamp(self._model_load_time) if self._model_load_time else None
+            last_loaded=self._last_loaded_at()
+        )
+    
+    def _last_loaded_at(self) -> Optional[datetime]:
+        """Get the model load time as a datetime, rebuilt only when a model is (re)loaded."""
+        if self._last_loaded_ts != self._model_load_time:
+            self._last_loaded_dt = datetime.fromtimestamp(self._model_load_time) if self._model_load_time else None
+            self._last_loaded_ts = self._model_load_time
+        return self._last_loaded_dt
+    
+    
+    def get_cache_stats(self) -> CacheStatsResponse:
+        """Get transcription result cache statistics."""
+        return CacheStatsResponse(
+            size=len(self._result_cache),
+            max_size=settings.result_cache_size,
+            hits=self._cache_hits,
+            misses=self._cache_misses
         )
     
+    def clear_cache(self) -> None:
+        """Drop all cached transcription results and decoded audio, and reset counters."""
+        self._result_cache.clear()
+        self._audio_cache.clear()
+        self._audio_cache_bytes = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def get_uptime(self) -> float:
         """Get service uptime in seconds."""
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
     
     def get_active_transcriptions(self) -> int:
         """Get number of active transcriptions."""
-        return self._active_transcriptions
+        return len(self._active_transcriptions)
     
     def is_model_loaded(self) -> bool:
         """Check if a model is currently loaded."""
@@ -465,13 +719,14 @@ class WhisperService:
         """Cleanup resources and shutdown executor."""
         try:
             # Wait for active transcriptions to complete
-            while self._active_transcriptions > 0:
-                await asyncio.sleep(1)
+            if self._active_transcriptions:
+                await asyncio.wait(set(self._active_transcriptions))
             
             # Shutdown executor
             self._executor.shutdown(wait=True)
             
-            # Clear model from memory
+            # Clear models from memory
+            self._models.clear()
             if self._model is not None:
                 del self._model
                 self._model = None
@@ -485,5 +740,5 @@ class WhisperService:
             pass
 
 
-# Global service instance
+# Global service instance, created once at import
 whisper_service = WhisperService()
@@ -0,0 +1,70 @@
+"""
+Unit tests for application settings.
+
+These tests verify that settings:
+- Are immutable once constructed
+- Validate and normalize environment values
+- Expose static tables as shared constants
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings, get_settings, SUPPORTED_FORMATS
+
+
+class TestSettings:
+    """Test suite for Settings."""
+    
+    def test_settings_is_frozen(self):
+        """Test that settings cannot be mutated after construction."""
+        settings = Settings()
+        
+        with pytest.raises(ValidationError):
+            settings.upload_dir = "/somewhere/else"
+    
+    def test_model_copy_returns_updated_copy(self):
+        """Test that model_copy is the way to derive modified settings."""
+        settings = Settings()
+        
+        updated = settings.model_copy(update={"beam_size": 1})
+        
+        assert updated is not settings
+        assert updated.beam_size == 1
+    
+    def test_get_settings_returns_cached_instance(self):
+        """Test that get_settings returns the same instance every time."""
+        assert get_settings() is get_settings()
+    
+    def test_invalid_model_size_raises_error(self):
+        """Test that unsupported model sizes are rejected."""
+        with pytest.raises(ValidationError):
+            Settings(model_size="huge")
+    
+    def test_log_level_is_uppercased(self):
+        """Test that log level is normalized to upper case."""
+        assert Settings(log_level="debug").log_level == "DEBUG"
+    
+    def test_non_positive_max_file_size_raises_error(self):
+        """Test that max file size must be greater than zero."""
+        with pytest.raises(ValidationError):
+            Settings(max_file_size_mb=0)
+    
+    def test_cors_origins_parsed_from_string(self):
+        """Test that comma-separated CORS origins are split and trimmed."""
+        settings = Settings(cors_origins=" http://a.com, http://b.com ,,")
+        
+        assert settings.cors_origins == ["http://a.com", "http://b.com"]
+    
+    def test_derived_values_reflect_configured_fields(self):
+        """Test that derived values reflect configured fields."""
+        settings = Settings(max_file_size_mb=10)
+        
+        assert settings.max_file_size_bytes == 10 * 1024 * 1024
+        assert settings.supported_formats_set is SUPPORTED_FORMATS
+    
+    def test_derived_values_follow_model_copy_updates(self):
+        """Test that derived values reflect fields changed through model_copy."""
+        updated = Settings().model_copy(update={"max_file_size_mb": 10})
+        
+        assert updated.max_file_size_bytes == 10 * 1024 * 1024
@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock
 
 from app.job_manager import JobManager, Job, JobStatus
+from app.models import TranscriptionResponse
 
 
 class TestJob:
@@ -92,6 +93,29 @@ class TestJob:
         assert job_dict["status"] == "PROCESSING"
         assert job_dict["progress"] == 50.0
         assert job_dict["message"] == "Processing..."
+    
+    def test_to_dict_keeps_result_model_instance(self):
+        """Test that to_dict passes the result model through without dumping it."""
+        job = Job("test-job-id")
+        result = TranscriptionResponse(
+            text="Transcribed text",
+            language="en",
+            duration=1.0,
+            segments=[],
+            model_used="base",
+            processing_time=0.1
+        )
+        job.set_result(result)
+        
+        job_dict = job.to_dict()
+        
+        assert job_dict["result"] is result
+    
+    def test_job_has_no_instance_dict(self):
+        """Test that jobs use slots instead of a per-instance __dict__."""
+        job = Job("test-job-id")
+        
+        assert not hasattr(job, "__dict__")
 
 
 class TestJobManager:
@@ -0,0 +1,107 @@
+"""
+HTTP-level tests for the FastAPI endpoints.
+
+These tests verify that the API properly handles:
+- NDJSON framing of the streaming endpoint
+- Segment, completed and error stream events
+- Temp file cleanup after a streamed response
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.whisper_service import whisper_service
+from app.exceptions import TranscriptionFailed
+from app.models import (
+    TranscriptionSegment,
+    TranscriptionStreamSegment,
+    TranscriptionStreamCompleted
+)
+
+
+class TestTranscribeStream:
+    """Test suite for the /transcribe/stream endpoint."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create a client without entering the lifespan, so no model is loaded."""
+        with patch.object(whisper_service, "is_model_loaded", return_value=True):
+            yield TestClient(app)
+    
+    @staticmethod
+    def post_audio(client):
+        """Upload a small WAV payload to the streaming endpoint."""
+        return client.post(
+            "/transcribe/stream",
+            files={"file": ("clip.wav", b"RIFF" + b"\x00" * 64, "audio/wav")}
+        )
+    
+    @staticmethod
+    def parse_ndjson(response):
+        """Split an NDJSON body into events, checking every line is newline-terminated."""
+        assert response.text.endswith("\n")
+        return [json.loads(line) for line in response.text.splitlines()]
+    
+    def test_stream_emits_segment_and_completed_events(self, client):
+        """Test that each decoded segment and the final result arrive as separate NDJSON lines."""
+        async def fake_stream(file_path, **kwargs):
+            yield TranscriptionStreamSegment(
+                segment=TranscriptionSegment(start_time=0.0, end_time=1.0, text="Hello")
+            )
+            yield TranscriptionStreamCompleted(
+                text="Hello", language="en", duration=1.0, model_used="base", processing_time=0.1
+            )
+        
+        with patch.object(whisper_service, "stream_transcription", fake_stream):
+            response = self.post_audio(client)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        segment, completed = self.parse_ndjson(response)
+        assert segment["type"] == "segment"
+        assert segment["segment"]["text"] == "Hello"
+        assert segment["segment"]["start_time"] == 0.0
+        assert segment["segment"]["end_time"] == 1.0
+        assert completed["type"] == "completed"
+        assert completed["text"] == "Hello"
+        assert completed["model_used"] == "base"
+    
+    def test_stream_reports_mid_stream_failure_in_band(self, client):
+        """Test that a failure after the first event ends the stream with an error event."""
+        async def fake_stream(file_path, **kwargs):
+            yield TranscriptionStreamSegment(
+                segment=TranscriptionSegment(start_time=0.0, end_time=1.0, text="Hello")
+            )
+            raise TranscriptionFailed(original_error="decoder crashed")
+        
+        with patch.object(whisper_service, "stream_transcription", fake_stream):
+            response = self.post_audio(client)
+        
+        assert response.status_code == 200
+        segment, error = self.parse_ndjson(response)
+        assert segment["type"] == "segment"
+        assert error["type"] == "error"
+        assert error["error"]["error_type"] == "TRANSCRIPTION_FAILED"
+        assert error["error"]["message"] == "Transcription failed"
+        assert error["error"]["details"]["original_error"] == "decoder crashed"
+    
+    def test_stream_removes_temp_file_after_response(self, client):
+        """Test that the uploaded temp file is deleted once the stream finishes."""
+        seen_paths = []
+        
+        async def fake_stream(file_path, **kwargs):
+            seen_paths.append(file_path)
+            yield TranscriptionStreamCompleted(
+                text="", language="en", duration=0.0, model_used="base", processing_time=0.0
+            )
+        
+        with patch.object(whisper_service, "stream_transcription", fake_stream):
+            response = self.post_audio(client)
+        
+        assert response.status_code == 200
+        assert len(seen_paths) == 1
+        assert not os.path.exists(seen_paths[0])
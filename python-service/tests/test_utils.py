@@ -9,9 +9,12 @@ These tests verify that utility functions properly handle:
 - Edge cases
 """
 
+import asyncio
 import pytest
-import tempfile
 import os
+import librosa
+import numpy as np
+import soundfile
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -21,7 +24,11 @@ from app.utils import (
     validate_file_size,
     detect_audio_format,
     validate_audio_file_integrity,
-    safe_filename
+    preprocess_audio,
+    safe_filename,
+    ensure_runtime_dirs,
+    get_memory_usage,
+    sample_memory_usage
 )
 from app.exceptions import (
     InvalidAudioFormat,
@@ -92,31 +99,23 @@ class TestFileValidation:
 class TestAudioFormatDetection:
     """Test suite for audio format detection."""
     
-    def test_detect_audio_format_with_mp3(self):
+    def test_detect_audio_format_with_mp3(self, tmp_path):
         """Test that detect_audio_format detects MP3."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'ID3\x03\x00fake mp3 content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'ID3\x03\x00fake mp3 content')
+        temp_path = str(audio_file)
         
-        try:
-            format_type = detect_audio_format(temp_path)
-            assert format_type == "mp3"
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
-    def test_detect_audio_format_with_wav(self):
+        format_type = detect_audio_format(temp_path)
+        assert format_type == "mp3"
+    
+    def test_detect_audio_format_with_wav(self, tmp_path):
         """Test that detect_audio_format detects WAV."""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            f.write(b'RIFF' + b'\x00' * 4 + b'WAVE')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.wav"
+        audio_file.write_bytes(b'RIFF' + b'\x00' * 4 + b'WAVE')
+        temp_path = str(audio_file)
         
-        try:
-            format_type = detect_audio_format(temp_path)
-            assert format_type == "wav"
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        format_type = detect_audio_format(temp_path)
+        assert format_type == "wav"
     
     def test_detect_audio_format_with_nonexistent_file(self):
         """Test that detect_audio_format handles nonexistent file."""
@@ -124,91 +123,129 @@ class TestAudioFormatDetection:
         # Should fallback to extension-based detection
         assert format_type == "mp3"
     
-    def test_detect_audio_format_with_invalid_file(self):
+    def test_detect_audio_format_with_invalid_file(self, tmp_path):
         """Test that detect_audio_format handles invalid file."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'invalid content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'invalid content')
+        temp_path = str(audio_file)
         
-        try:
-            format_type = detect_audio_format(temp_path)
-            # Should fallback to extension
-            assert format_type == "mp3"
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        format_type = detect_audio_format(temp_path)
+        # Should fallback to extension
+        assert format_type == "mp3"
 
 
 class TestAudioFileIntegrity:
     """Test suite for audio file integrity validation."""
     
-    def test_validate_audio_file_integrity_with_valid_file(self):
+    def test_validate_audio_file_integrity_with_valid_file(self, tmp_path):
         """Test that validate_audio_file_integrity accepts valid file."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'fake audio content')
+        temp_path = str(audio_file)
         
-        try:
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value.returncode = 0
-                mock_run.return_value.stdout = b'{"format": {}}'
-                with patch('librosa.get_duration', return_value=1.0):
-                    is_valid, error = validate_audio_file_integrity(temp_path)
-                    assert is_valid is True
-                    assert error is None
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
-    def test_validate_audio_file_integrity_with_invalid_file(self):
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b'{"format": {}}'
+            with patch('librosa.get_duration', return_value=1.0):
+                is_valid, error = validate_audio_file_integrity(temp_path)
+                assert is_valid is True
+                assert error is None
+    
+    def test_validate_audio_file_integrity_with_invalid_file(self, tmp_path):
         """Test that validate_audio_file_integrity rejects invalid file."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'invalid content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'invalid content')
+        temp_path = str(audio_file)
         
-        try:
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value.returncode = 1
-                mock_run.return_value.stderr = b'Invalid file'
-                is_valid, error = validate_audio_file_integrity(temp_path)
-                assert is_valid is False
-                assert error is not None
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 1
+            mock_run.return_value.stderr = b'Invalid file'
+            is_valid, error = validate_audio_file_integrity(temp_path)
+            assert is_valid is False
+            assert error is not None
     
-    def test_validate_audio_file_integrity_with_timeout(self):
+    def test_validate_audio_file_integrity_with_timeout(self, tmp_path):
         """Test that validate_audio_file_integrity handles timeout."""
         import subprocess
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'fake content')
+        temp_path = str(audio_file)
         
-        try:
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired("ffprobe", 10)):
-                is_valid, error = validate_audio_file_integrity(temp_path)
-                assert is_valid is False
-                assert error is not None
-                assert "timed out" in error.lower() or "timeout" in error.lower()
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
-    def test_validate_audio_file_integrity_without_ffprobe(self):
+        with patch('subprocess.run', side_effect=subprocess.TimeoutExpired("ffprobe", 10)):
+            is_valid, error = validate_audio_file_integrity(temp_path)
+            assert is_valid is False
+            assert error is not None
+            assert "timed out" in error.lower() or "timeout" in error.lower()
+    
+    def test_validate_audio_file_integrity_without_ffprobe(self, tmp_path):
         """Test that validate_audio_file_integrity handles missing ffprobe."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake content')
-            temp_path = f.name
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b'fake content')
+        temp_path = str(audio_file)
         
-        try:
-            with patch('subprocess.run', side_effect=FileNotFoundError()):
-                # Should skip validation when ffprobe not available
-                is_valid, error = validate_audio_file_integrity(temp_path)
-                # May return True or False depending on librosa fallback
-                assert isinstance(is_valid, bool)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        with patch('subprocess.run', side_effect=FileNotFoundError()):
+            # Should skip validation when ffprobe not available
+            is_valid, error = validate_audio_file_integrity(temp_path)
+            # May return True or False depending on librosa fallback
+            assert isinstance(is_valid, bool)
+
+
+class TestPreprocessAudio:
+    """Test suite for audio preprocessing."""
+    
+    def test_preprocess_audio_decodes_file_once(self, tmp_path):
+        """Test that a file passing the integrity probe is decoded once."""
+        temp_path = str(tmp_path / "audio.wav")
+        soundfile.write(temp_path, np.zeros(1600, dtype=np.float32), 16000)
+        
+        with patch('app.utils.librosa.load', wraps=librosa.load) as mock_load, \
+             patch('app.utils.validate_audio_file_integrity', return_value=(True, None)) as mock_integrity:
+            audio = preprocess_audio(temp_path, target_sr=16000)
+        
+        assert mock_load.call_count == 1
+        mock_integrity.assert_called_once_with(temp_path)
+        assert audio.dtype == np.float32
+        assert len(audio) == 1600
+
+
+class TestRuntimeDirs:
+    """Test suite for runtime directory setup."""
+    
+    def test_ensure_runtime_dirs_creates_upload_dir_once(self, tmp_path):
+        """Test that ensure_runtime_dirs creates the upload dir only once."""
+        upload_dir = str(tmp_path / "uploads")
+        with patch('app.utils.settings') as mock_settings, \
+             patch('app.utils._runtime_dirs_ready', False), \
+             patch('app.utils.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            mock_settings.upload_dir = upload_dir
+            
+            ensure_runtime_dirs()
+            ensure_runtime_dirs()
+            
+            assert os.path.isdir(upload_dir)
+            mock_makedirs.assert_called_once_with(upload_dir, exist_ok=True)
+
+
+class TestMemoryUsage:
+    """Test suite for the sampled memory usage gauge."""
+    
+    @pytest.mark.asyncio
+    async def test_get_memory_usage_returns_sampled_value_while_sampler_runs(self):
+        """Test that readers get the cached sample instead of querying the OS."""
+        with patch('app.utils.read_memory_usage', return_value=123.0) as mock_read:
+            task = asyncio.create_task(sample_memory_usage(60.0))
+            await asyncio.sleep(0)
+            
+            assert get_memory_usage() == 123.0
+            assert get_memory_usage() == 123.0
+            assert mock_read.call_count == 1
+            
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            
+            mock_read.return_value = 456.0
+            assert get_memory_usage() == 456.0
 
 
 class TestSafeFilename:
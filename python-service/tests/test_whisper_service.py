@@ -12,11 +12,13 @@ These tests verify that the service properly handles:
 
 import pytest
 import asyncio
-import tempfile
-import os
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from faster_whisper import WhisperModel
+import threading
+import numpy as np
+# Service code awaits executor futures, not the mocked callables, so plain Mock is enough;
+# use AsyncMock only for a callable the code under test awaits itself (it is much slower)
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 
+from app.config import Settings
 from app.whisper_service import WhisperService
 from app.exceptions import (
     ModelNotLoaded,
@@ -26,37 +28,66 @@ from app.exceptions import (
 )
 
 
+# Stand-in for a loaded model in tests that only check that one is present
+_DUMMY_MODEL = object()
+
+
 class TestWhisperService:
     """Test suite for WhisperService."""
     
     @pytest.fixture
     def service(self):
-        """Create a fresh service instance for each test."""
-        # Reset singleton
-        WhisperService._instance = None
-        return WhisperService()
+        """Create a fresh service instance for each test and stop its worker threads afterwards."""
+        service = WhisperService()
+        # Some tests swap in a mock executor, so hold on to the real one
+        executor = service._executor
+        yield service
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    @pytest.fixture
-    def temp_audio_file(self):
-        """Create a temporary audio file for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio content')
-            yield f.name
-        if os.path.exists(f.name):
-            os.unlink(f.name)
+    @pytest.fixture(autouse=True)
+    def stub_memory_usage(self):
+        """Stub the memory probe so load and info calls don't read process stats."""
+        with patch('app.whisper_service.get_memory_usage', return_value=1024.0):
+            yield
     
     # ========== Model Loading Tests ==========
     
     @pytest.mark.asyncio
-    async def test_load_model_when_already_loaded_returns_cached(self, service):
+    @patch.object(WhisperService, '_load_model_sync', return_value=_DUMMY_MODEL)
+    async def test_load_model_when_already_loaded_returns_cached(self, mock_load, service):
         """Test that loading an already loaded model returns cached info."""
-        with patch.object(service, '_load_model_sync', return_value=Mock()):
-            await service.load_model("base")
-            result = await service.load_model("base")
-            
-            assert result["success"] is True
-            assert result["model_size"] == "base"
-            assert result["load_time_seconds"] == 0.0
+        await service.load_model("base")
+        result = await service.load_model("base")
+        
+        assert result["success"] is True
+        assert result["model_size"] == "base"
+        assert result["load_time_seconds"] == 0.0
+    
+    @pytest.mark.asyncio
+    @patch.object(WhisperService, '_load_model_sync')
+    async def test_load_model_switching_back_reuses_cached_model(self, mock_load, service):
+        """Test that switching back to a recently used model size skips the reload."""
+        base_model, small_model = Mock(), Mock()
+        mock_load.side_effect = [base_model, small_model]
+        
+        await service.load_model("base")
+        await service.load_model("small")
+        result = await service.load_model("base")
+        
+        assert mock_load.call_count == 2
+        assert result["load_time_seconds"] == 0.0
+        assert service._model is base_model
+        assert service.get_current_model_size() == "base"
+    
+    @pytest.mark.asyncio
+    @patch.object(WhisperService, '_load_model_sync', side_effect=lambda size: Mock())
+    async def test_load_model_evicts_least_recently_used_model(self, mock_load, service):
+        """Test that loading past max_cached_models drops the least recently used model."""
+        await service.load_model("tiny")
+        await service.load_model("base")
+        await service.load_model("small")
+        
+        assert list(service._models) == ["base", "small"]
     
     @pytest.mark.asyncio
     async def test_load_model_when_concurrent_loading_raises_exception(self, service):
@@ -67,18 +98,100 @@ class TestWhisperService:
             await service.load_model("base")
     
     @pytest.mark.asyncio
-    async def test_load_model_when_model_load_fails_raises_exception(self, service):
-        """Test that model loading failure raises exception."""
-        with patch.object(service, '_load_model_sync', side_effect=Exception("Load failed")):
-            with pytest.raises(ModelLoadFailed):
-                await service.load_model("base")
+    @patch.object(WhisperService, '_load_model_sync', return_value=_DUMMY_MODEL)
+    async def test_load_model_switches_to_cached_model_while_another_loads(self, mock_load, service):
+        """Test that a model kept in memory is served even while a different size is loading."""
+        await service.load_model("base")
+        service._is_loading = True
+        service._loading_model_size = "small"
+        
+        result = await service.load_model("base")
+        
+        assert result["load_time_seconds"] == 0.0
+        assert service.get_current_model_size() == "base"
+        assert mock_load.call_count == 1
+        with pytest.raises(ModelLoadFailed):
+            await service.load_model("tiny")
     
+    @pytest.mark.parametrize("error,model_size", [
+        (Exception("Load failed"), "base"),
+        (ValueError("Invalid model"), "invalid-model"),
+    ])
     @pytest.mark.asyncio
-    async def test_load_model_with_invalid_model_size_raises_exception(self, service):
-        """Test that invalid model size raises exception."""
-        with patch.object(service, '_load_model_sync', side_effect=ValueError("Invalid model")):
-            with pytest.raises(ModelLoadFailed):
-                await service.load_model("invalid-model")
+    @patch.object(WhisperService, '_load_model_sync')
+    async def test_load_model_when_loader_fails_raises_exception(self, mock_load, service, error, model_size):
+        """Test that a loader failure, including an invalid model size, raises ModelLoadFailed."""
+        mock_load.side_effect = error
+        
+        with pytest.raises(ModelLoadFailed):
+            await service.load_model(model_size)
+    
+    @pytest.mark.parametrize("num_threads,workers,expected", [(4, 3, 1), (8, 2, 4), (2, 4, 1)])
+    def test_load_model_sync_splits_cpu_threads_across_workers(self, service, num_threads, workers, expected):
+        """Test that the CPU thread budget is divided between CTranslate2 workers."""
+        with patch('app.whisper_service.WhisperModel') as mock_whisper_model, \
+             patch('app.whisper_service.settings') as mock_settings:
+            mock_settings.num_threads = num_threads
+            mock_settings.model_num_workers = workers
+            mock_settings.model_warmup_enabled = False
+            service._load_model_sync("base")
+        
+        kwargs = mock_whisper_model.call_args.kwargs
+        assert kwargs["cpu_threads"] == expected
+        assert kwargs["num_workers"] == workers
+    
+    def test_load_model_sync_default_config_gives_one_worker_all_threads(self, service):
+        """Test that by default a single CTranslate2 worker gets the whole thread budget."""
+        with patch('app.whisper_service.WhisperModel') as mock_whisper_model, \
+             patch('app.whisper_service.settings', Settings(num_threads=4, model_warmup_enabled=False)):
+            service._load_model_sync("base")
+        
+        kwargs = mock_whisper_model.call_args.kwargs
+        assert kwargs["cpu_threads"] == 4
+        assert kwargs["num_workers"] == 1
+    
+    def test_load_model_sync_warms_up_model_and_ignores_warmup_failure(self, service):
+        """Test that a freshly loaded model decodes silence once and warmup errors don't fail the load."""
+        mock_model = Mock()
+        mock_model.transcribe.side_effect = RuntimeError("warmup failed")
+        
+        with patch('app.whisper_service.WhisperModel', return_value=mock_model):
+            model = service._load_model_sync("base")
+        
+        assert model is mock_model
+        mock_model.transcribe.assert_called_once()
+        assert not mock_model.transcribe.call_args.args[0].any()
+    
+    @pytest.mark.parametrize("vad_filter", [True, False])
+    def test_warmup_model_sync_warms_vad_only_when_enabled(self, service, vad_filter):
+        """Test that warmup runs VAD over the silence only when VAD filtering is enabled."""
+        mock_model = Mock()
+        mock_model.transcribe.return_value = ([], Mock())
+        
+        with patch('app.whisper_service.settings') as mock_settings, \
+             patch('app.whisper_service.get_speech_timestamps') as mock_vad:
+            mock_settings.target_sample_rate = 16000
+            mock_settings.vad_filter = vad_filter
+            service._warmup_model_sync(mock_model)
+        
+        assert mock_model.transcribe.call_args.kwargs["vad_filter"] is False
+        assert mock_vad.called is vad_filter
+    
+    @pytest.mark.parametrize("device,configured,expected", [
+        ("cuda", "int8", "int8_float16"),
+        ("cuda", "int8_float16", "int8_float16"),
+        ("cuda", "float32", "float32"),
+        ("cpu", "int8", "int8"),
+        ("cpu", "int8_float16", "int8"),
+        ("cpu", "float16", "int8"),
+    ])
+    def test_get_compute_type_maps_configured_type_to_device(self, service, device, configured, expected):
+        """Test that compute type falls back to one supported by the device."""
+        service._device = device
+        
+        with patch('app.whisper_service.settings') as mock_settings:
+            mock_settings.compute_type = configured
+            assert service._get_compute_type() == expected
     
     # ========== Transcription Tests ==========
     
@@ -93,94 +206,172 @@ class TestWhisperService:
     @pytest.mark.asyncio
     async def test_transcribe_audio_with_nonexistent_file_raises_exception(self, service):
         """Test that transcription with nonexistent file raises exception."""
-        service._model = Mock()
+        service._model = _DUMMY_MODEL
         
         with pytest.raises(TranscriptionFailed):
             await service.transcribe_audio("/nonexistent/file.mp3")
     
+    @pytest.mark.parametrize("target,error", [
+        ("validate_audio_file", Exception("Invalid file")),
+        ("preprocess_audio", AudioProcessingError("Preprocessing failed")),
+        ("transcribe", Exception("Transcription failed")),
+    ])
     @pytest.mark.asyncio
-    async def test_transcribe_audio_when_transcription_fails_raises_exception(self, service):
-        """Test that transcription failure raises exception."""
+    async def test_transcribe_audio_when_step_fails_raises_exception(self, service, target, error):
+        """Test that a failure in validation, preprocessing or decoding raises TranscriptionFailed."""
         service._model = Mock()
-        mock_model = Mock()
-        mock_model.transcribe = Mock(side_effect=Exception("Transcription failed"))
-        service._model = mock_model
-        
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio')
-            temp_path = f.name
         
-        try:
-            with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}):
-                with patch('app.whisper_service.preprocess_audio', return_value=temp_path):
-                    with pytest.raises(TranscriptionFailed):
-                        await service.transcribe_audio(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        with patch.multiple('app.whisper_service', validate_audio_file=DEFAULT, preprocess_audio=DEFAULT) as mocks:
+            mocks['validate_audio_file'].return_value = {"duration": 1.0}
+            mocks['preprocess_audio'].return_value = "test.mp3"
+            failing = service._model.transcribe if target == "transcribe" else mocks[target]
+            failing.side_effect = error
+            
+            with pytest.raises(TranscriptionFailed):
+                await service.transcribe_audio("test.mp3")
     
     @pytest.mark.asyncio
     async def test_transcribe_audio_when_info_is_none_raises_exception(self, service):
         """Test that transcription with None info raises exception."""
-        service._model = Mock()
         mock_model = Mock()
         
-        # Mock transcribe to return segments with None info
-        def mock_transcribe(*args, **kwargs):
-            segments = [Mock(start=0.0, end=1.0, text="test")]
-            return segments, None
-        mock_model.transcribe = mock_transcribe
+        # Mock transcribe to return segments with None info; the segments are built once, not per call
+        mock_model.transcribe.return_value = ([Mock(start=0.0, end=1.0, text="test")], None)
         service._model = mock_model
         
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio')
-            temp_path = f.name
+        with patch.multiple('app.whisper_service',
+                            validate_audio_file=Mock(return_value={"duration": 1.0}),
+                            preprocess_audio=Mock(return_value="test.mp3")):
+            with pytest.raises(TranscriptionFailed):
+                await service._transcribe_sync("test.mp3", None, 0.0, "transcribe", None)
+    
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_with_same_content_hash_returns_cached_result(self, service):
+        """Test that repeated content is served from the result cache."""
+        service._model = _DUMMY_MODEL
+        service._model_size = "base"
+        whisper_result = {"text": "hello", "language": "en", "segments": []}
+        
+        with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}), \
+             patch('app.whisper_service.preprocess_audio', return_value=np.zeros(16000, dtype=np.float32)), \
+             patch.object(service, '_transcribe_sync', return_value=whisper_result) as mock_sync:
+            first = await service.transcribe_audio("test.mp3", content_hash="abc")
+            second = await service.transcribe_audio("test.mp3", content_hash="abc")
         
-        try:
-            with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}):
-                with patch('app.whisper_service.preprocess_audio', return_value=temp_path):
-                    with pytest.raises(TranscriptionFailed):
-                        await service._transcribe_sync(temp_path, None, 0.0, "transcribe", None)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        assert mock_sync.call_count == 1
+        assert second.text == first.text == "hello"
+        stats = service.get_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
     
     @pytest.mark.asyncio
-    async def test_transcribe_audio_when_preprocessing_fails_raises_exception(self, service):
-        """Test that preprocessing failure raises exception."""
+    async def test_transcribe_audio_with_same_content_hash_reuses_decoded_audio(self, service):
+        """Test that re-transcribing the same content with other options skips preprocessing."""
+        service._model = _DUMMY_MODEL
+        service._model_size = "base"
+        whisper_result = {"text": "hello", "language": "en", "segments": []}
+        
+        with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}), \
+             patch('app.whisper_service.preprocess_audio', return_value=np.zeros(16000, dtype=np.float32)) as mock_preprocess, \
+             patch.object(service, '_transcribe_sync', return_value=whisper_result) as mock_sync:
+            await service.transcribe_audio("test.mp3", temperature=0.0, content_hash="abc")
+            await service.transcribe_audio("test.mp3", temperature=0.5, content_hash="abc")
+        
+        assert mock_sync.call_count == 2
+        assert mock_preprocess.call_count == 1
+        assert not mock_sync.call_args.args[0].flags.writeable
+    
+    @pytest.mark.asyncio
+    async def test_prepare_audio_decodes_off_the_event_loop_thread(self, service):
+        """Test that validation and decoding run in the thread pool rather than on the event loop."""
+        decode_threads = []
+        
+        def fake_preprocess(file_path, progress_callback=None):
+            decode_threads.append(threading.get_ident())
+            return np.zeros(16000, dtype=np.float32)
+        
+        with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}), \
+             patch('app.whisper_service.preprocess_audio', side_effect=fake_preprocess):
+            file_info, audio = await service._prepare_audio("test.mp3")
+        
+        assert file_info == {"duration": 1.0}
+        assert len(audio) == 16000
+        assert decode_threads and decode_threads[0] != threading.get_ident()
+    
+    def test_transcribe_sync_passes_language_and_task_to_model(self, service):
+        """Test that requested language and task reach the model instead of the defaults."""
         service._model = Mock()
+        service._model.transcribe.return_value = ([], Mock(language="fr", language_probability=0.9))
+        
+        service._transcribe_sync("audio", "fr", 0.0, "transcribe")
+        
+        kwargs = service._model.transcribe.call_args.kwargs
+        assert kwargs["language"] == "fr"
+        assert kwargs["task"] == "transcribe"
+        assert "vad_filter" in kwargs
+    
+    def test_create_transcription_response_builds_segments_and_confidence(self, service):
+        """Test that segments are stripped and confidence averages the available log probabilities."""
+        whisper_result = {
+            "text": " hello world ",
+            "language": "en",
+            "segments": [
+                {"start": 0.0, "end": 1.0, "text": " hello ", "avg_logprob": -0.2},
+                {"start": 1.0, "end": 2.0, "text": " world ", "avg_logprob": -0.4},
+                {"start": 2.0, "end": 3.0, "text": "", "avg_logprob": None}
+            ]
+        }
         
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio')
-            temp_path = f.name
+        response = service._create_transcription_response(whisper_result, {"duration": 3.0}, 0.5, "base")
         
-        try:
-            with patch('app.whisper_service.validate_audio_file', return_value={"duration": 1.0}):
-                with patch('app.whisper_service.preprocess_audio', 
-                          side_effect=AudioProcessingError("Preprocessing failed")):
-                    with pytest.raises(TranscriptionFailed):
-                        await service.transcribe_audio(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        assert [seg.text for seg in response.segments] == ["hello", "world", ""]
+        assert response.confidence_score == pytest.approx(0.35)
+        assert response.text == "hello world"
+        assert response.model_used == "base"
+    
+    def test_create_transcription_response_skips_validation_of_generated_segments(self, service):
+        """Test that server-generated segments are not re-validated, so zero-length segments pass through."""
+        whisper_result = {"text": "hi", "language": "en", "segments": [{"start": 1.0, "end": 1.0, "text": "hi"}]}
+        
+        response = service._create_transcription_response(whisper_result, {"duration": 1.0}, 0.1, "base")
+        
+        assert response.segments[0].start_time == response.segments[0].end_time == 1.0
+        assert '"end_time":1.0' in response.model_dump_json()
+    
+    @pytest.mark.parametrize("batch_size,vad_filter,batched", [
+        (8, True, True),
+        (8, False, False),
+        (0, True, False),
+    ])
+    def test_decode_uses_batched_pipeline_only_when_enabled_with_vad(self, service, batch_size, vad_filter, batched):
+        """Test that batched decoding is used only when batch_size > 1 and VAD is on."""
+        model = Mock()
+        
+        with patch('app.whisper_service.settings') as mock_settings, \
+             patch('app.whisper_service.BatchedInferencePipeline') as mock_pipeline:
+            mock_settings.batch_size = batch_size
+            service._decode(model, "audio", {"vad_filter": vad_filter})
+        
+        assert mock_pipeline.called is batched
+        assert model.transcribe.called is not batched
     
     @pytest.mark.asyncio
-    async def test_transcribe_audio_when_file_validation_fails_raises_exception(self, service):
-        """Test that file validation failure raises exception."""
+    async def test_stream_transcription_yields_segments_then_completed(self, service):
+        """Test that streaming yields one event per segment followed by a completion event."""
+        segments = [Mock(start=0.0, end=1.0, text=" hello "), Mock(start=1.0, end=2.0, text=" world ")]
         service._model = Mock()
+        service._model.transcribe.return_value = (iter(segments), Mock(language="en"))
+        service._model_size = "base"
         
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            f.write(b'fake audio')
-            temp_path = f.name
+        with patch('app.whisper_service.validate_audio_file', return_value={"duration": 2.0}), \
+             patch('app.whisper_service.preprocess_audio', return_value="audio"):
+            events = [event async for event in service.stream_transcription("test.mp3")]
         
-        try:
-            with patch('app.whisper_service.validate_audio_file', 
-                      side_effect=Exception("Invalid file")):
-                with pytest.raises(TranscriptionFailed):
-                    await service.transcribe_audio(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        assert [event.type for event in events] == ["segment", "segment", "completed"]
+        assert events[0].segment.text == "hello"
+        assert events[-1].text == "hello world"
+        assert events[-1].language == "en"
+        assert service.get_active_transcriptions() == 0
     
     # ========== Model Info Tests ==========
     
@@ -196,41 +387,43 @@ class TestWhisperService:
     
     def test_get_model_info_when_model_loaded_returns_info(self, service):
         """Test that model info returns correct info when model loaded."""
-        service._model = Mock()
+        service._model = _DUMMY_MODEL
         service._model_size = "base"
         service._model_load_time = 1000.0
         
-        with patch('app.whisper_service.get_memory_usage', return_value=1024.0):
-            info = service.get_model_info()
-            
-            assert info.model_size == "base"
-            assert info.is_loaded is True
-    
-    # ========== Utility Tests ==========
-    
-    def test_is_model_loaded_when_model_exists_returns_true(self, service):
-        """Test that is_model_loaded returns True when model exists."""
-        service._model = Mock()
+        info = service.get_model_info()
         
-        assert service.is_model_loaded() is True
+        assert info.model_size == "base"
+        assert info.is_loaded is True
+        assert info.memory_usage_mb == 1024.0
     
-    def test_is_model_loaded_when_model_none_returns_false(self, service):
-        """Test that is_model_loaded returns False when model is None."""
-        service._model = None
+    def test_get_model_info_reuses_last_loaded_until_model_reloads(self, service):
+        """Test that last_loaded is rebuilt only when the model load time changes."""
+        service._model = _DUMMY_MODEL
+        service._model_size = "base"
+        service._model_load_time = 1000.0
         
-        assert service.is_model_loaded() is False
+        first = service.get_model_info().last_loaded
+        assert service.get_model_info().last_loaded is first
+        
+        service._model_load_time = 2000.0
+        assert service.get_model_info().last_loaded is not first
     
-    def test_get_current_model_size_when_loaded_returns_size(self, service):
-        """Test that get_current_model_size returns size when loaded."""
-        service._model_size = "base"
+    # ========== Utility Tests ==========
+    
+    @pytest.mark.parametrize("model,expected", [(_DUMMY_MODEL, True), (None, False)])
+    def test_is_model_loaded_reflects_model_presence(self, service, model, expected):
+        """Test that is_model_loaded returns whether a model is set."""
+        service._model = model
         
-        assert service.get_current_model_size() == "base"
+        assert service.is_model_loaded() is expected
     
-    def test_get_current_model_size_when_not_loaded_returns_none(self, service):
-        """Test that get_current_model_size returns None when not loaded."""
-        service._model_size = None
+    @pytest.mark.parametrize("model_size", ["base", None])
+    def test_get_current_model_size_returns_loaded_size(self, service, model_size):
+        """Test that get_current_model_size returns the loaded size, or None when not loaded."""
+        service._model_size = model_size
         
-        assert service.get_current_model_size() is None
+        assert service.get_current_model_size() == model_size
     
     def test_get_uptime_returns_positive_value(self, service):
         """Test that get_uptime returns positive value."""
@@ -243,26 +436,27 @@ class TestWhisperService:
     @pytest.mark.asyncio
     async def test_cleanup_when_active_transcriptions_waits(self, service):
         """Test that cleanup waits for active transcriptions."""
-        service._active_transcriptions = 1
+        done = service._begin_transcription()
         service._executor = Mock()
         service._executor.shutdown = Mock()
         
-        # Mock active_transcriptions to decrease after delay
-        async def decrease_transcriptions():
-            await asyncio.sleep(0.1)
-            service._active_transcriptions = 0
+        # Finish the transcription once cleanup is waiting on it
+        async def finish_transcription():
+            await asyncio.sleep(0)
+            service._executor.shutdown.assert_not_called()
+            service._end_transcription(done)
         
-        asyncio.create_task(decrease_transcriptions())
+        asyncio.create_task(finish_transcription())
         await service.cleanup()
         
+        assert done.done()
         service._executor.shutdown.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_cleanup_when_model_loaded_clears_model(self, service):
         """Test that cleanup clears model when loaded."""
-        service._model = Mock()
+        service._model = _DUMMY_MODEL
         service._model_size = "base"
-        service._active_transcriptions = 0
         service._executor = Mock()
         service._executor.shutdown = Mock()
         
@@ -282,15 +476,25 @@ class TestWhisperService:
         with pytest.raises(ModelLoadFailed):
             await service.load_model("base")
     
+    @pytest.mark.asyncio
+    @patch.object(WhisperService, '_load_model_sync', return_value=_DUMMY_MODEL)
+    async def test_concurrent_load_of_same_model_loads_once(self, mock_load, service):
+        """Test that concurrent loads of the same size wait for one load instead of duplicating it."""
+        first, second = await asyncio.gather(service.load_model("base"), service.load_model("base"))
+        
+        assert mock_load.call_count == 1
+        assert first["load_time_seconds"] >= second["load_time_seconds"] == 0.0
+        assert not service._is_loading
+    
     @pytest.mark.asyncio
     async def test_concurrent_transcription_tracking(self, service):
         """Test that active transcription count is tracked correctly."""
-        initial_count = service._active_transcriptions
+        initial_count = service.get_active_transcriptions()
         
-        service._active_transcriptions += 1
+        done = service._begin_transcription()
         assert service.get_active_transcriptions() == initial_count + 1
         
-        service._active_transcriptions -= 1
+        service._end_transcription(done)
         assert service.get_active_transcriptions() == initial_count
 
 